@@ -1,7 +1,14 @@
+import sys
+
 import attrs
 
 
-@attrs.define
+def _intern_id(value: str) -> str:
+    # sys.intern only accepts exact str; subclasses (e.g. StrEnum members) pass through
+    return sys.intern(value) if type(value) is str else value
+
+
+@attrs.define(slots=True)
 class AggregateRoot:
     """
     Base class for Aggregate Roots in Domain-Driven Design (DDD).
@@ -15,5 +22,12 @@ class AggregateRoot:
           can add domain-specific attributes and behavior.
         - By default, `id` can be modified after creation. Use `frozen=True`
           in @attrs.define if you want it to be immutable.
+        - Instances are slotted (no per-instance `__dict__`), which keeps the
+          footprint small when large numbers of aggregates are held in memory.
+          Subclasses declared with @attrs.define stay slotted as well.
+        - Plain `str` ids are interned with `sys.intern` on construction and
+          assignment, so dictionary lookups keyed by an already-stored id can
+          match by identity instead of comparing characters. Instances of
+          `str` subclasses are kept as given.
     """
-    id: str = attrs.field(init=True)
+    id: str = attrs.field(init=True, converter=_intern_id)
@@ -0,0 +1,91 @@
+from collections import deque
+from typing import TypeVar, Generic, Any
+
+from api.domain.aggregate_root import AggregateRoot
+
+# Define a type variable T that is bound to AggregateRoot
+T = TypeVar('T', bound=AggregateRoot)
+
+
+class AggregatePool(Generic[T]):
+    """
+    Bounded pool of reusable Aggregate Root instances of a single type.
+
+    Deserialization-heavy workloads create and discard large numbers of
+    short-lived aggregates. The pool keeps released instances around so
+    they can be re-initialized in place instead of allocating a new object
+    for every record.
+
+    Notes:
+        - Only instances whose type is exactly the pooled type are accepted.
+        - A released instance must no longer be referenced by the caller;
+          it will be re-initialized and handed out again by `acquire`.
+        - The pool is not thread-safe beyond the atomicity of `deque`
+          append/pop operations.
+    """
+
+    def __init__(self, aggregate_type: type[T], capacity: int = 1024) -> None:
+        """
+        Initializes the pool.
+
+        Parameters:
+            aggregate_type (type[T]):
+                The concrete Aggregate Root type pooled by this instance.
+                Must be a subclass of `AggregateRoot`.
+
+            capacity (int, optional):
+                Maximum number of idle instances kept by the pool.
+                Defaults to 1024.
+
+        Raises:
+            TypeError:
+                - If `aggregate_type` is not a type.
+                - If `aggregate_type` is not a subclass of AggregateRoot.
+            ValueError:
+                If `capacity` is negative.
+        """
+        if not isinstance(aggregate_type, type):
+            raise TypeError("aggregate_type must be a type")
+
+        if not issubclass(aggregate_type, AggregateRoot):
+            raise TypeError("aggregate_type must be a subclass of AggregateRoot")
+
+        if capacity < 0:
+            raise ValueError("capacity must be a non-negative integer")
+
+        self._aggregate_type = aggregate_type
+        self._idle: deque[T] = deque(maxlen=capacity)
+
+    def acquire(self, *args: Any, **kwargs: Any) -> T:
+        """
+        Returns an initialized aggregate, reusing an idle instance if one is
+        available.
+
+        Parameters:
+            *args, **kwargs:
+                Arguments forwarded to the aggregate's `__init__`.
+
+        Returns:
+            T: An aggregate initialized with the given arguments.
+        """
+        try:
+            aggregate = self._idle.pop()
+        except IndexError:
+            return self._aggregate_type(*args, **kwargs)
+
+        aggregate.__init__(*args, **kwargs)
+        return aggregate
+
+    def release(self, aggregate: T) -> None:
+        """
+        Returns an aggregate to the pool. Once the pool is full, the oldest
+        idle instance is discarded.
+
+        Parameters:
+            aggregate (T): The aggregate instance to recycle.
+        """
+        if type(aggregate) is self._aggregate_type:
+            self._idle.append(aggregate)
+
+    def __len__(self) -> int:
+        return len(self._idle)
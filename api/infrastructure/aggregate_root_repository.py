@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Type, Callable
+from typing import TypeVar, Generic, Type, Callable, Collection
 
 from api.domain.aggregate_root import AggregateRoot
 
@@ -20,8 +20,8 @@ class AggregateRootRepository(ABC, Generic[T]):
     Abstract Methods:
         - exists(_id: str) -> bool
         - find(_id: str) -> T | None
-        - find_all(predicate: Callable[[T], bool] | None) -> list[T]
-        - find_ids() -> list[str]
+        - find_all(predicate: Callable[[T], bool] | None) -> Collection[T]
+        - find_ids() -> Collection[str]
         - delete(aggregate: T) -> None
         - delete_all() -> None
         - save(aggregate: T) -> None
@@ -76,8 +76,21 @@ class AggregateRootRepository(ABC, Generic[T]):
         """
         pass
 
+    def find_many(self, ids: list[str]) -> list[T | None]:
+        """
+        Retrieves several Aggregate Roots by their identifiers.
+
+        Parameters:
+            ids (list[str]): Unique identifiers of the aggregates.
+
+        Returns:
+            list[T | None]: The aggregates in the same order as `ids`, with
+            None for identifiers that were not found.
+        """
+        return [self.find(_id) for _id in ids]
+
     @abstractmethod
-    def find_all(self, predicate: Callable[[T], bool] = None) -> list[T]:
+    def find_all(self, predicate: Callable[[T], bool] = None) -> Collection[T]:
         """
         Retrieves all stored Aggregate Roots. Optionally applies a predicate
         to filter the results.
@@ -88,20 +101,33 @@ class AggregateRootRepository(ABC, Generic[T]):
                 if it should be included in the result.
 
         Returns:
-            list[T]: A list of aggregates matching the criteria.
+            Collection[T]: The aggregates matching the criteria. Without a
+            predicate, implementations may return a read-only view over
+            their storage instead of a copy.
         """
         pass
 
     @abstractmethod
-    def find_ids(self) -> list[str]:
+    def find_ids(self) -> Collection[str]:
         """
         Returns all identifiers of the aggregates stored in the repository.
 
         Returns:
-            list[str]: A list of aggregate identifiers.
+            Collection[str]: The aggregate identifiers. Implementations may
+            return a read-only view over their storage instead of a copy.
         """
         pass
 
+    def find_ids_list(self) -> list[str]:
+        """
+        Returns all identifiers of the aggregates stored in the repository as
+        a new list, detached from the repository's storage.
+
+        Returns:
+            list[str]: A list of aggregate identifiers.
+        """
+        return list(self.find_ids())
+
     @abstractmethod
     def delete(self, aggregate: T) -> None:
         """
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import TypeVar, Callable, Any, Coroutine
+from typing import TypeVar, Callable
 
 from trio import to_thread, CapacityLimiter
 
@@ -9,6 +9,31 @@ from api.infrastructure.aggregate_root_repository import AggregateRootRepository
 # Define a type variable T that is bound to AggregateRoot
 T = TypeVar('T', bound=AggregateRoot)
 
+# Limiter shared by repositories that were not given their own
+_default_limiter: CapacityLimiter | None = None
+
+
+def set_default_limiter(limiter: CapacityLimiter | None) -> None:
+    """
+    Sets the `CapacityLimiter` shared application-wide by every asynchronous
+    repository that was created without its own limiter or `max_threads`.
+
+    The limiter is stored in a module-level global, so the change is seen by
+    all tasks and all existing repositories from their next call onwards.
+
+    Parameters:
+        limiter (CapacityLimiter | None):
+            The limiter to share. None restores Trio's default thread limiter.
+
+    Notes:
+        Until a limiter is set, repositories without their own limiter use
+        Trio's global default thread limiter (40 threads unless changed). This
+        replaces the former per-repository `CapacityLimiter(5)`; pass
+        `max_threads=5` to keep that behavior for a specific repository.
+    """
+    global _default_limiter
+    _default_limiter = limiter
+
 
 class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
     """
@@ -18,18 +43,24 @@ class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
     inside worker threads using Trio's `to_thread.run_sync`.
 
     This class does not implement repository logic itself; it delegates to
-    the synchronous methods defined in the parent class while exposing async
-    equivalents for use in asynchronous workflows.
+    the synchronous methods implemented by the concrete repository while
+    exposing async equivalents for use in asynchronous workflows.
 
     Features:
         - Offloads synchronous repository calls to worker threads.
         - Uses a `CapacityLimiter` to control the maximum number of concurrent
-          thread executions.
+          thread executions. Unless configured otherwise, the limiter is
+          shared application-wide rather than owned by each repository.
         - Provides async versions of all repository operations such as:
           `exists_async`, `find_async`, `find_all_async`, `save_async`, etc.
     """
 
-    def __init__(self, aggregate_type: type[T], max_threads: int = 5) -> None:
+    def __init__(
+            self,
+            aggregate_type: type[T],
+            max_threads: int | None = None,
+            limiter: CapacityLimiter | None = None,
+    ) -> None:
         """
         Initializes the asynchronous repository.
 
@@ -39,17 +70,35 @@ class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
                 Must be a subclass of `AggregateRoot`.
 
             max_threads (int, optional):
-                Maximum number of worker threads allowed for async execution.
-                Defaults to 5.
+                Maximum number of worker threads reserved for this repository
+                alone. Creates a private `CapacityLimiter`.
+
+            limiter (CapacityLimiter, optional):
+                Limiter to use for this repository, typically shared with
+                other repositories.
+
+        Raises:
+            ValueError:
+                If both `max_threads` and `limiter` are given.
 
         Notes:
             A `CapacityLimiter` is used to ensure controlled concurrency when
-            offloading synchronous repository calls to worker threads.
+            offloading synchronous repository calls to worker threads. When
+            neither `max_threads` nor `limiter` is given, the limiter set via
+            `set_default_limiter` is used, falling back to Trio's global
+            default thread limiter (40 threads unless changed), so concurrency
+            stays bounded application-wide. Earlier versions gave each
+            repository a private `CapacityLimiter(5)` instead.
         """
+        if max_threads is not None and limiter is not None:
+            raise ValueError("max_threads and limiter are mutually exclusive")
+
         super().__init__(aggregate_type)
-        self._thread_limiter = CapacityLimiter(max_threads)
+        if max_threads is not None:
+            limiter = CapacityLimiter(max_threads)
+        self._thread_limiter = limiter
 
-    async def exists_async(self, _id: str) -> Coroutine[Any, Any, bool]:
+    async def exists_async(self, _id: str) -> bool:
         """
         Asynchronously checks whether an Aggregate Root with the given ID exists.
 
@@ -57,17 +106,15 @@ class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
             _id (str): Unique identifier of the aggregate.
 
         Returns:
-            Coroutine[Any, Any, bool]:
-                A coroutine resolving to True if the aggregate exists,
-                False otherwise.
+            bool: True if the aggregate exists, False otherwise.
         """
-        return to_thread.run_sync(
-            super().exists,
+        return await to_thread.run_sync(
+            self.exists,
             _id,
-            limiter=self._thread_limiter,
+            limiter=self._current_limiter(),
         )
 
-    async def find_async(self, _id: str) -> Coroutine[Any, Any, T | None]:
+    async def find_async(self, _id: str) -> T | None:
         """
         Asynchronously retrieves an Aggregate Root by its identifier.
 
@@ -75,17 +122,33 @@ class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
             _id (str): Unique identifier of the aggregate.
 
         Returns:
-            Coroutine[Any, Any, T | None]:
-                A coroutine resolving to the aggregate instance if found,
-                otherwise None.
+            T | None: The aggregate instance if found, otherwise None.
         """
-        return to_thread.run_sync(
-            super().find,
+        return await to_thread.run_sync(
+            self.find,
             _id,
-            limiter=self._thread_limiter,
+            limiter=self._current_limiter(),
         )
 
-    async def find_all_async(self, predicate: Callable[[T], bool] = None) -> Coroutine[Any, Any, list[T]]:
+    async def find_many_async(self, ids: list[str]) -> list[T | None]:
+        """
+        Asynchronously retrieves several Aggregate Roots by their identifiers
+        using a single worker-thread call.
+
+        Parameters:
+            ids (list[str]): Unique identifiers of the aggregates.
+
+        Returns:
+            list[T | None]: The aggregates in the same order as `ids`, with
+            None for identifiers that were not found.
+        """
+        return await to_thread.run_sync(
+            self.find_many,
+            ids,
+            limiter=self._current_limiter(),
+        )
+
+    async def find_all_async(self, predicate: Callable[[T], bool] = None) -> list[T]:
         """
         Asynchronously retrieves all stored Aggregate Roots. Optionally applies
         a predicate function to filter results.
@@ -96,70 +159,80 @@ class AsyncAggregateRootRepository(AggregateRootRepository[T], ABC):
                 if it should be included in the result.
 
         Returns:
-            Coroutine[Any, Any, list[T]]:
-                A coroutine resolving to a list of aggregates.
+            list[T]: A new list of the aggregates matching the criteria.
         """
-        return to_thread.run_sync(
-            super().find_all,
+        return await to_thread.run_sync(
+            self._find_all_list,
             predicate,
-            limiter=self._thread_limiter,
+            limiter=self._current_limiter(),
         )
 
-    async def find_ids_async(self) -> Coroutine[Any, Any, list[str]]:
+    async def find_ids_async(self) -> list[str]:
         """
         Asynchronously retrieves all aggregate identifiers stored in the repository.
 
         Returns:
-            Coroutine[Any, Any, list[str]]:
-                A coroutine resolving to a list of aggregate IDs.
+            list[str]: A new list of aggregate identifiers.
         """
-        return to_thread.run_sync(
-            super().find_ids,
-            args=(),
-            limiter=self._thread_limiter,
+        return await to_thread.run_sync(
+            self.find_ids_list,
+            limiter=self._current_limiter(),
         )
 
-    async def delete_async(self, aggregate: T) -> Coroutine[Any, Any, None]:
+    async def delete_async(self, aggregate: T) -> None:
         """
         Asynchronously deletes the provided Aggregate Root instance.
 
         Parameters:
             aggregate (T): The aggregate instance to delete.
-
-        Returns:
-            Coroutine[Any, Any, None]
         """
-        return to_thread.run_sync(
-            super().delete,
+        await to_thread.run_sync(
+            self.delete,
             aggregate,
-            limiter=self._thread_limiter,
+            limiter=self._current_limiter(),
         )
 
-    async def delete_all_async(self) -> Coroutine[Any, Any, None]:
+    async def delete_all_async(self) -> None:
         """
         Asynchronously deletes all Aggregate Roots stored in the repository.
-
-        Returns:
-            Coroutine[Any, Any, None]
         """
-        return to_thread.run_sync(
-            super().delete_all,
-            args=(),
-            limiter=self._thread_limiter,
+        await to_thread.run_sync(
+            self.delete_all,
+            limiter=self._current_limiter(),
         )
 
-    async def save_async(self, aggregate: T) -> Coroutine[Any, Any, None]:
+    async def save_async(self, aggregate: T) -> None:
         """
         Asynchronously saves or updates an Aggregate Root instance.
 
         Parameters:
             aggregate (T): The aggregate instance to save.
-
-        Returns:
-            Coroutine[Any, Any, None]
         """
-        return to_thread.run_sync(
-            super().save,
+        await to_thread.run_sync(
+            self.save,
             aggregate,
-            limiter=self._thread_limiter,
+            limiter=self._current_limiter(),
         )
+
+    async def save_all_async(self, aggregates: list[T]) -> None:
+        """
+        Asynchronously saves or updates multiple Aggregate Root instances
+        using a single worker-thread call.
+
+        Parameters:
+            aggregates (list[T]): A list of aggregate instances to be saved.
+        """
+        await to_thread.run_sync(
+            self.save_all,
+            aggregates,
+            limiter=self._current_limiter(),
+        )
+
+    def _find_all_list(self, predicate: Callable[[T], bool] | None) -> list[T]:
+        # Copied in the worker thread so callers never hold a live storage view
+        return list(self.find_all(predicate))
+
+    def _current_limiter(self) -> CapacityLimiter | None:
+        if self._thread_limiter is not None:
+            return self._thread_limiter
+        return _default_limiter
@@ -1,6 +1,9 @@
-from typing import TypeVar, Callable
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import TypeVar, Callable, Any, Collection
 
 from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.aggregate_pool import AggregatePool
 from api.infrastructure.aggregate_root_repository import AggregateRootRepository
 
 # Define a type variable T that is bound to AggregateRoot
@@ -24,7 +27,13 @@ class InMemoryAggregateRootRepository(AggregateRootRepository[T]):
         - Useful for unit tests, mocks, and simple applications.
     """
 
-    def __init__(self, aggregate_type: type[T]) -> None:
+    def __init__(
+            self,
+            aggregate_type: type[T],
+            pool: AggregatePool[T] | None = None,
+            indexed_fields: list[str] | None = None,
+            range_indexed_fields: list[str] | None = None,
+    ) -> None:
         """
         Initializes the in-memory repository.
 
@@ -33,12 +42,83 @@ class InMemoryAggregateRootRepository(AggregateRootRepository[T]):
                 The concrete Aggregate Root type managed by this repository.
                 Must be a subclass of `AggregateRoot`.
 
+            pool (AggregatePool[T], optional):
+                Pool that deleted aggregates are released to, so a
+                deserializer sharing the same pool can reuse them. Only
+                worthwhile for deserialization-heavy workloads; callers must
+                not keep references to aggregates after deleting them.
+
+            indexed_fields (list[str], optional):
+                Aggregate attributes to maintain equality indexes for. Queries
+                through `find_by` on these fields are answered from the index
+                instead of scanning every stored aggregate. Indexed attributes
+                must hold hashable values; saving an aggregate with an
+                unhashable value raises TypeError and leaves the repository
+                unchanged.
+
+            range_indexed_fields (list[str], optional):
+                Aggregate attributes to maintain ordered indexes for, answering
+                `find_in_range` without a full scan. Range-indexed fields are
+                also usable with `find_by`. Their values must be hashable and
+                mutually comparable (e.g. timestamps or numeric tenant ids).
+                None is rejected, so optional attributes need a sentinel
+                value. Saving an aggregate whose value cannot be compared
+                with the stored ones raises TypeError and leaves the
+                repository unchanged.
+
         Notes:
             The repository uses an internal dictionary mapping aggregate IDs
-            (strings) to aggregate instances.
+            (strings) to aggregate instances. `find_ids` and `find_all`
+            without a predicate return live views over that dictionary;
+            use `find_ids_list` or copy the result before modifying the
+            repository while iterating. The async counterparts always return
+            new lists.
+
+            Indexes and columns registered through `register_column` reflect
+            attribute values as of the last `save`/`save_all` of each
+            aggregate; aggregates mutated in place must be saved again for
+            indexed or column queries to observe the change.
         """
         super().__init__(aggregate_type)
         self._storage: dict[str, T] = {}
+        self._pool = pool
+        self._getters: dict[str, Callable[[T], Any]] = {}
+        self._indexes: dict[str, dict[Any, set[str]]] = {
+            field: {} for field in (*(indexed_fields or ()), *(range_indexed_fields or ()))
+        }
+        self._sorted_values: dict[str, list[Any]] = {field: [] for field in range_indexed_fields or ()}
+        self._index_getters = tuple(attrgetter(field) for field in self._indexes)
+        self._indexed_values: dict[str, tuple[Any, ...]] = {}
+        self._columns: dict[str, list[Any]] = {}
+        self._column_getters: dict[str, Callable[[T], Any]] = {}
+        self._rows: list[T | None] = []
+        self._row_index: dict[str, int] = {}
+        self._dead_rows = 0
+
+    def register_column(self, field: str) -> None:
+        """
+        Starts keeping the values of attribute `field` in a contiguous column
+        aligned with the stored aggregates, so `find_all_where` can scan the
+        column instead of visiting every aggregate object.
+
+        Parameters:
+            field (str): Name of the aggregate attribute to keep a column for.
+        """
+        if field in self._columns:
+            return
+
+        # Build the column before registering anything, so a missing attribute
+        # leaves the repository as it was
+        rows = self._rows if self._columns else list(self._storage.values())
+        getter = attrgetter(field)
+        column = [None if aggregate is None else getter(aggregate) for aggregate in rows]
+
+        if not self._columns:
+            self._rows = rows
+            self._row_index = {aggregate.id: row for row, aggregate in enumerate(rows)}
+            self._dead_rows = 0
+        self._column_getters[field] = getter
+        self._columns[field] = column
 
     def exists(self, _id: str) -> bool:
         return _id in self._storage
@@ -46,24 +126,229 @@ class InMemoryAggregateRootRepository(AggregateRootRepository[T]):
     def find(self, _id: str) -> T | None:
         return self._storage.get(_id)
 
-    def find_all(self, predicate: Callable[[T], bool] = None) -> list[T]:
+    def find_many(self, ids: list[str]) -> list[T | None]:
+        get = self._storage.get
+        return [get(_id) for _id in ids]
+
+    def find_all(self, predicate: Callable[[T], bool] = None) -> Collection[T]:
         if predicate is None:
-            return list(self._storage.values())
+            return self._storage.values()
         return [agg for agg in self._storage.values() if predicate(agg)]
 
-    def find_ids(self) -> list[str]:
-        return list(self._storage.keys())
+    def find_by(self, field: str, value: Any) -> list[T]:
+        """
+        Retrieves all stored Aggregate Roots whose attribute `field` equals
+        `value`.
+
+        Parameters:
+            field (str): Name of the aggregate attribute to compare.
+            value (Any): Value the attribute must be equal to.
+
+        Returns:
+            list[T]: A list of aggregates matching the criteria.
+        """
+        buckets = self._indexes.get(field)
+        if buckets is not None:
+            ids = buckets.get(value)
+            if not ids:
+                return []
+            storage = self._storage
+            return [storage[_id] for _id in ids]
+
+        getter = self._getters.get(field)
+        if getter is None:
+            getter = self._getters[field] = attrgetter(field)
+        return [agg for agg in self._storage.values() if getter(agg) == value]
+
+    def find_in_range(self, field: str, low: Any, high: Any) -> list[T]:
+        """
+        Retrieves all stored Aggregate Roots whose attribute `field` lies
+        within `low` and `high`, both inclusive.
+
+        Parameters:
+            field (str): Name of the aggregate attribute to compare.
+            low (Any): Lower bound of the range.
+            high (Any): Upper bound of the range.
+
+        Returns:
+            list[T]: A list of aggregates matching the criteria. For
+            range-indexed fields the result is ordered by attribute value.
+        """
+        sorted_values = self._sorted_values.get(field)
+        if sorted_values is not None:
+            buckets = self._indexes[field]
+            storage = self._storage
+            start = bisect_left(sorted_values, low)
+            stop = bisect_right(sorted_values, high)
+            return [storage[_id] for value in sorted_values[start:stop] for _id in buckets[value]]
+
+        getter = self._getters.get(field)
+        if getter is None:
+            getter = self._getters[field] = attrgetter(field)
+        return [agg for agg in self._storage.values() if low <= getter(agg) <= high]
+
+    def find_all_where(self, field: str, predicate: Callable[[Any], bool]) -> list[T]:
+        """
+        Retrieves all stored Aggregate Roots whose attribute `field`
+        satisfies `predicate`.
+
+        Parameters:
+            field (str): Name of the aggregate attribute to test.
+            predicate (Callable[[Any], bool]):
+                Function that receives the attribute value and returns True
+                if the aggregate should be included in the result.
+
+        Returns:
+            list[T]: A list of aggregates matching the criteria.
+        """
+        column = self._columns.get(field)
+        if column is not None:
+            return [row for row, value in zip(self._rows, column) if row is not None and predicate(value)]
+
+        getter = self._getters.get(field)
+        if getter is None:
+            getter = self._getters[field] = attrgetter(field)
+        return [agg for agg in self._storage.values() if predicate(getter(agg))]
+
+    def find_ids(self) -> Collection[str]:
+        return self._storage.keys()
 
     def delete(self, aggregate: T) -> None:
-        if aggregate.id in self._storage:
-            del self._storage[aggregate.id]
+        _id = aggregate.id
+        stored = self._storage.pop(_id, None)
+        if stored is None:
+            return
+        if self._indexes:
+            self._unindex(_id)
+        if self._columns:
+            self._remove_row(_id)
+        if self._pool is not None:
+            self._pool.release(stored)
 
     def delete_all(self) -> None:
         self._storage.clear()
+        self._indexed_values.clear()
+        for buckets in self._indexes.values():
+            buckets.clear()
+        for sorted_values in self._sorted_values.values():
+            sorted_values.clear()
+        self._rows.clear()
+        self._row_index.clear()
+        self._dead_rows = 0
+        for column in self._columns.values():
+            column.clear()
 
     def save(self, aggregate: T) -> None:
-        self._storage[aggregate.id] = aggregate
+        if self._indexes or self._columns:
+            self._save_tracked(aggregate)
+        else:
+            self._storage[aggregate.id] = aggregate
 
     def save_all(self, aggregates: list[T]) -> None:
+        if self._indexes or self._columns:
+            save_tracked = self._save_tracked
+            for aggregate in aggregates:
+                save_tracked(aggregate)
+            return
+
+        storage = self._storage
         for aggregate in aggregates:
-            self._storage[aggregate.id] = aggregate
+            storage[aggregate.id] = aggregate
+
+    def _save_tracked(self, aggregate: T) -> None:
+        # Read and validate every tracked value before touching any state, so
+        # an aggregate that cannot be indexed leaves the repository unchanged
+        _id = aggregate.id
+        current = self._index_values(aggregate) if self._indexes else None
+        values = [getter(aggregate) for getter in self._column_getters.values()] if self._columns else None
+
+        if current is not None:
+            self._index(_id, current)
+        if values is not None:
+            self._store_row(aggregate, values)
+        self._storage[_id] = aggregate
+
+    def _index_values(self, aggregate: T) -> tuple[Any, ...]:
+        current = tuple(getter(aggregate) for getter in self._index_getters)
+        for field, value in zip(self._indexes, current):
+            hash(value)
+            sorted_values = self._sorted_values.get(field)
+            if sorted_values is not None:
+                if value is None:
+                    raise TypeError(f"range-indexed field '{field}' must not be None")
+                # Runs the same comparisons insort will, so incomparable values fail here
+                bisect_left(sorted_values, value)
+        return current
+
+    def _index(self, _id: str, current: tuple[Any, ...]) -> None:
+        previous = self._indexed_values.get(_id)
+        if previous == current:
+            return
+
+        for position, (field, buckets) in enumerate(self._indexes.items()):
+            value = current[position]
+            old_value = None if previous is None else previous[position]
+            if previous is not None and old_value == value:
+                continue
+
+            # Link before unlinking so insort sees the list that was validated
+            ids = buckets.get(value)
+            if ids is None:
+                sorted_values = self._sorted_values.get(field)
+                if sorted_values is not None:
+                    insort(sorted_values, value)
+                ids = buckets[value] = set()
+            ids.add(_id)
+            if previous is not None:
+                self._unlink(field, buckets, old_value, _id)
+        self._indexed_values[_id] = current
+
+    def _unindex(self, _id: str) -> None:
+        previous = self._indexed_values.pop(_id, None)
+        if previous is None:
+            return
+        for (field, buckets), value in zip(self._indexes.items(), previous):
+            self._unlink(field, buckets, value, _id)
+
+    def _unlink(self, field: str, buckets: dict[Any, set[str]], value: Any, _id: str) -> None:
+        ids = buckets[value]
+        ids.discard(_id)
+        if not ids:
+            del buckets[value]
+            sorted_values = self._sorted_values.get(field)
+            if sorted_values is not None:
+                del sorted_values[bisect_left(sorted_values, value)]
+
+    def _store_row(self, aggregate: T, values: list[Any]) -> None:
+        _id = aggregate.id
+        row = self._row_index.get(_id)
+        if row is None:
+            self._row_index[_id] = len(self._rows)
+            self._rows.append(aggregate)
+            for column, value in zip(self._columns.values(), values):
+                column.append(value)
+        else:
+            self._rows[row] = aggregate
+            for column, value in zip(self._columns.values(), values):
+                column[row] = value
+
+    def _remove_row(self, _id: str) -> None:
+        row = self._row_index.pop(_id, None)
+        if row is None:
+            return
+
+        # Tombstone the row; columns are compacted once most rows are dead
+        self._rows[row] = None
+        for column in self._columns.values():
+            column[row] = None
+        self._dead_rows += 1
+        if self._dead_rows * 2 > len(self._rows):
+            self._compact_rows()
+
+    def _compact_rows(self) -> None:
+        live = [row for row, aggregate in enumerate(self._rows) if aggregate is not None]
+        self._rows = [self._rows[row] for row in live]
+        for field, column in self._columns.items():
+            self._columns[field] = [column[row] for row in live]
+        self._row_index = {aggregate.id: row for row, aggregate in enumerate(self._rows)}
+        self._dead_rows = 0
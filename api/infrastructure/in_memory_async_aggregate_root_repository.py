@@ -0,0 +1,66 @@
+from typing import TypeVar, Callable
+
+from trio.lowlevel import checkpoint
+
+from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.async_aggregate_root_repository import AsyncAggregateRootRepository
+from api.infrastructure.in_memory_aggregate_root_repository import InMemoryAggregateRootRepository
+
+# Define a type variable T that is bound to AggregateRoot
+T = TypeVar('T', bound=AggregateRoot)
+
+
+class InMemoryAsyncAggregateRootRepository(InMemoryAggregateRootRepository[T], AsyncAggregateRootRepository[T]):
+    """
+    Asynchronous variant of `InMemoryAggregateRootRepository`.
+
+    The in-memory operations never block, so handing them to a worker thread
+    would cost far more than the dictionary operation itself. The async
+    methods are therefore overridden to run the synchronous implementation
+    directly in the calling task instead of going through
+    `to_thread.run_sync`. Each method still executes a Trio checkpoint
+    first, so it yields to the scheduler and honours cancellation like the
+    thread-offloading version.
+
+    Characteristics:
+        - Same storage semantics as `InMemoryAggregateRootRepository`.
+        - No worker threads are used; the thread limiter is never acquired.
+        - Drop-in replacement wherever an `AsyncAggregateRootRepository`
+          is expected.
+    """
+
+    async def exists_async(self, _id: str) -> bool:
+        await checkpoint()
+        return self.exists(_id)
+
+    async def find_async(self, _id: str) -> T | None:
+        await checkpoint()
+        return self.find(_id)
+
+    async def find_many_async(self, ids: list[str]) -> list[T | None]:
+        await checkpoint()
+        return self.find_many(ids)
+
+    async def find_all_async(self, predicate: Callable[[T], bool] = None) -> list[T]:
+        await checkpoint()
+        return list(self.find_all(predicate))
+
+    async def find_ids_async(self) -> list[str]:
+        await checkpoint()
+        return self.find_ids_list()
+
+    async def delete_async(self, aggregate: T) -> None:
+        await checkpoint()
+        self.delete(aggregate)
+
+    async def delete_all_async(self) -> None:
+        await checkpoint()
+        self.delete_all()
+
+    async def save_async(self, aggregate: T) -> None:
+        await checkpoint()
+        self.save(aggregate)
+
+    async def save_all_async(self, aggregates: list[T]) -> None:
+        await checkpoint()
+        self.save_all(aggregates)
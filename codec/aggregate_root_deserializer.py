@@ -2,11 +2,24 @@ from abc import ABC
 from typing import TypeVar, Generic
 
 from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.aggregate_pool import AggregatePool
 
 AggregateType = TypeVar('AggregateType', bound=AggregateRoot)
 ReadType = TypeVar('ReadType')
 
 
 class AggregateRootDeserializer(ABC, Generic[ReadType, AggregateType]):
-    def deserialize(self, data: ReadType) -> AggregateType:
+    def deserialize(self, data: ReadType, pool: AggregatePool[AggregateType] | None = None) -> AggregateType:
+        """
+        Builds an Aggregate Root from its serialized representation.
+
+        Parameters:
+            data (ReadType): The serialized aggregate.
+            pool (AggregatePool[AggregateType], optional):
+                When provided, implementations should obtain the instance via
+                `pool.acquire(...)` instead of calling the constructor.
+
+        Returns:
+            AggregateType: The deserialized aggregate.
+        """
         pass
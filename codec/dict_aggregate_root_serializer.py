@@ -0,0 +1,65 @@
+from typing import TypeVar, Any, Callable
+
+import attrs
+
+from api.domain.aggregate_root import AggregateRoot
+from codec.aggregate_root_serializer import AggregateRootSerializer
+
+AggregateType = TypeVar('AggregateType', bound=AggregateRoot)
+
+
+class DictAggregateRootSerializer(AggregateRootSerializer[AggregateType, dict[str, Any]]):
+    """
+    Serializes attrs-based Aggregate Roots into plain dictionaries keyed by
+    attribute name.
+
+    For every aggregate type a dedicated function is generated once, reading
+    each attribute directly and building the dictionary in a single literal,
+    e.g. `{'id': aggregate.id, 'name': aggregate.name}`. Subsequent calls
+    dispatch on the aggregate's exact type, so no per-call reflection over
+    the attrs fields is needed.
+
+    Notes:
+        - Types are registered lazily on first use; `register` can be called
+          up front to move code generation out of the hot path.
+        - The produced dictionary is shallow; nested values are returned as-is.
+    """
+
+    def __init__(self) -> None:
+        self._serializers: dict[type, Callable[[AggregateType], dict[str, Any]]] = {}
+
+    def register(self, aggregate_type: type[AggregateType]) -> Callable[[AggregateType], dict[str, Any]]:
+        """
+        Generates and caches the serialization function for an aggregate type.
+
+        Parameters:
+            aggregate_type (type[AggregateType]):
+                The concrete attrs-based Aggregate Root type to serialize.
+
+        Returns:
+            Callable[[AggregateType], dict[str, Any]]: The generated function.
+
+        Raises:
+            TypeError:
+                - If `aggregate_type` is not a subclass of AggregateRoot.
+                - If `aggregate_type` is not an attrs class.
+        """
+        if not isinstance(aggregate_type, type) or not issubclass(aggregate_type, AggregateRoot):
+            raise TypeError("aggregate_type must be a subclass of AggregateRoot")
+
+        if not attrs.has(aggregate_type):
+            raise TypeError("aggregate_type must be an attrs class")
+
+        items = ", ".join(f"{field.name!r}: aggregate.{field.name}" for field in attrs.fields(aggregate_type))
+        source = f"def serialize(aggregate):\n    return {{{items}}}\n"
+        namespace: dict[str, Any] = {}
+        exec(compile(source, f"<{aggregate_type.__qualname__} serializer>", "exec"), namespace)
+
+        serializer = self._serializers[aggregate_type] = namespace["serialize"]
+        return serializer
+
+    def serialize(self, aggregate: AggregateType) -> dict[str, Any]:
+        serializer = self._serializers.get(type(aggregate))
+        if serializer is None:
+            serializer = self.register(type(aggregate))
+        return serializer(aggregate)
@@ -0,0 +1,59 @@
+import attrs
+import pytest
+
+from api.domain.aggregate_root import AggregateRoot
+from codec.dict_aggregate_root_serializer import DictAggregateRootSerializer
+
+
+@attrs.define
+class User(AggregateRoot):
+    name: str = ""
+    _password: str = ""
+
+
+@attrs.define
+class Admin(User):
+    level: int = 0
+
+
+def test_serializes_extra_and_private_fields():
+    serializer = DictAggregateRootSerializer()
+
+    assert serializer.serialize(User("a", "x", "secret")) == {"id": "a", "name": "x", "_password": "secret"}
+
+
+def test_dispatches_on_exact_type():
+    serializer = DictAggregateRootSerializer()
+
+    assert serializer.serialize(AggregateRoot("a")) == {"id": "a"}
+    assert serializer.serialize(Admin("b", "y", "pw", 3)) == {"id": "b", "name": "y", "_password": "pw", "level": 3}
+    assert serializer.serialize(User("c")) == {"id": "c", "name": "", "_password": ""}
+
+
+def test_register_returns_generated_function():
+    serializer = DictAggregateRootSerializer()
+    function = serializer.register(User)
+
+    assert function(User("a", "x")) == {"id": "a", "name": "x", "_password": ""}
+    assert serializer.serialize(User("a", "x")) == function(User("a", "x"))
+
+
+def test_serialized_dict_is_a_new_object_per_call():
+    serializer = DictAggregateRootSerializer()
+    user = User("a", "x")
+
+    first = serializer.serialize(user)
+    first["name"] = "changed"
+
+    assert serializer.serialize(user) == {"id": "a", "name": "x", "_password": ""}
+
+
+def test_register_rejects_non_aggregates():
+    serializer = DictAggregateRootSerializer()
+
+    with pytest.raises(TypeError):
+        serializer.register(dict)
+
+    with pytest.raises(TypeError):
+        serializer.register(User("a"))
+
@@ -0,0 +1,29 @@
+from enum import StrEnum
+
+from api.domain.aggregate_root import AggregateRoot
+
+
+class Kind(StrEnum):
+    A = "a"
+
+
+class Name(str):
+    pass
+
+
+def test_plain_str_ids_are_interned():
+    first = AggregateRoot("".join(["ab", "cd"]))
+    second = AggregateRoot("".join(["abc", "d"]))
+    assert first.id is second.id
+
+    first.id = "".join(["x", "y"])
+    assert first.id is AggregateRoot("".join(["x", "y"])).id
+
+
+def test_str_subclass_ids_are_kept():
+    assert AggregateRoot(Kind.A).id is Kind.A
+
+    aggregate = AggregateRoot("a")
+    aggregate.id = Name("b")
+    assert type(aggregate.id) is Name
+    assert aggregate.id == "b"
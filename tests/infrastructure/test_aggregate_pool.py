@@ -0,0 +1,89 @@
+import attrs
+import pytest
+
+from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.aggregate_pool import AggregatePool
+from api.infrastructure.in_memory_aggregate_root_repository import InMemoryAggregateRootRepository
+
+
+@attrs.define
+class User(AggregateRoot):
+    name: str = ""
+    age: int = 0
+
+
+def test_acquire_allocates_when_empty():
+    pool = AggregatePool(User)
+
+    user = pool.acquire("a", "x")
+
+    assert user == User("a", "x")
+    assert len(pool) == 0
+
+
+def test_acquire_reinitializes_released_instance():
+    pool = AggregatePool(User)
+    user = User("a", "x", 3)
+    pool.release(user)
+
+    recycled = pool.acquire("b")
+
+    assert recycled is user
+    assert recycled == User("b")
+    assert len(pool) == 0
+
+
+def test_release_respects_capacity():
+    pool = AggregatePool(User, capacity=1)
+    pool.release(User("a"))
+    pool.release(User("b"))
+
+    assert len(pool) == 1
+
+
+def test_release_ignores_other_types():
+    pool = AggregatePool(User)
+    pool.release(AggregateRoot("a"))
+
+    assert len(pool) == 0
+    assert type(pool.acquire("b")) is User
+
+
+def test_zero_capacity_never_keeps_instances():
+    pool = AggregatePool(User, capacity=0)
+    user = User("a")
+    pool.release(user)
+
+    assert pool.acquire("b") is not user
+
+
+def test_rejects_invalid_arguments():
+    with pytest.raises(TypeError):
+        AggregatePool(User("a"))
+
+    with pytest.raises(TypeError):
+        AggregatePool(str)
+
+    with pytest.raises(ValueError):
+        AggregatePool(User, capacity=-1)
+
+
+def test_repository_delete_releases_stored_aggregate():
+    pool = AggregatePool(User)
+    repository = InMemoryAggregateRootRepository(User, pool=pool)
+    user = pool.acquire("a", "x", 1)
+    repository.save(user)
+
+    repository.delete(User("a"))
+
+    assert len(pool) == 1
+    assert pool.acquire("b") is user
+
+
+def test_repository_delete_of_missing_aggregate_releases_nothing():
+    pool = AggregatePool(User)
+    repository = InMemoryAggregateRootRepository(User, pool=pool)
+
+    repository.delete(User("a"))
+
+    assert len(pool) == 0
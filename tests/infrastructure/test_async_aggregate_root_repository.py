@@ -0,0 +1,214 @@
+import attrs
+import pytest
+import trio
+
+from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.async_aggregate_root_repository import AsyncAggregateRootRepository, set_default_limiter
+from api.infrastructure.in_memory_aggregate_root_repository import InMemoryAggregateRootRepository
+from api.infrastructure.in_memory_async_aggregate_root_repository import InMemoryAsyncAggregateRootRepository
+
+
+@attrs.define
+class User(AggregateRoot):
+    name: str = ""
+
+
+class ThreadedRepository(InMemoryAggregateRootRepository[User], AsyncAggregateRootRepository[User]):
+    def __init__(self, aggregate_type: type[User], **limits) -> None:
+        InMemoryAggregateRootRepository.__init__(self, aggregate_type)
+        AsyncAggregateRootRepository.__init__(self, aggregate_type, **limits)
+
+
+REPOSITORIES = [ThreadedRepository, InMemoryAsyncAggregateRootRepository]
+
+
+@pytest.mark.parametrize("repository_type", REPOSITORIES)
+def test_async_listings_are_copies(repository_type):
+    async def main():
+        repository = repository_type(User)
+        repository.save_all([User("a"), User("b"), User("c")])
+
+        ids = await repository.find_ids_async()
+        assert type(ids) is list
+        for _id in ids:
+            await repository.delete_async(User(_id))
+        assert await repository.find_ids_async() == []
+
+        repository.save_all([User("a"), User("b")])
+        aggregates = await repository.find_all_async()
+        assert type(aggregates) is list
+        for aggregate in aggregates:
+            await repository.delete_async(aggregate)
+        assert await repository.find_all_async() == []
+
+    trio.run(main)
+
+
+def test_in_memory_async_operations_run_without_threads():
+    async def main():
+        repository = InMemoryAsyncAggregateRootRepository(User)
+
+        await repository.save_async(User("a", "x"))
+
+        assert await repository.exists_async("a") is True
+        assert await repository.find_async("a") == User("a", "x")
+        await repository.delete_all_async()
+        assert await repository.find_ids_async() == []
+
+    trio.run(main)
+
+
+def test_in_memory_async_operations_are_cancellable():
+    async def main():
+        repository = InMemoryAsyncAggregateRootRepository(User)
+        repository.save(User("a"))
+
+        with trio.move_on_after(0) as scope:
+            await repository.find_async("a")
+        assert scope.cancelled_caught
+
+        with trio.CancelScope() as scope:
+            scope.cancel()
+            await repository.save_async(User("b"))
+        assert scope.cancelled_caught
+        assert repository.find("b") is None
+
+    trio.run(main)
+
+
+def test_threaded_async_calls_return_values_not_coroutines():
+    async def main():
+        repository = ThreadedRepository(User)
+
+        assert await repository.save_async(User("a", "x")) is None
+        assert await repository.exists_async("a") is True
+        assert await repository.exists_async("missing") is False
+        assert await repository.find_async("a") == User("a", "x")
+        assert await repository.find_async("missing") is None
+        assert await repository.find_all_async() == [User("a", "x")]
+        assert await repository.find_all_async(lambda user: user.name == "y") == []
+        assert await repository.find_ids_async() == ["a"]
+
+        assert await repository.delete_async(User("a")) is None
+        assert await repository.exists_async("a") is False
+
+        repository.save(User("b"))
+        assert await repository.delete_all_async() is None
+        assert await repository.find_ids_async() == []
+
+    trio.run(main)
+
+
+
+class LimiterProbeRepository(ThreadedRepository):
+    def __init__(self, *args, probe: trio.CapacityLimiter, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.probe = probe
+        self.borrowed: list[int] = []
+
+    def exists(self, _id: str) -> bool:
+        self.borrowed.append(self.probe.borrowed_tokens)
+        return super().exists(_id)
+
+
+@pytest.fixture
+def reset_default_limiter():
+    yield
+    set_default_limiter(None)
+
+
+def test_default_limiter_is_shared_application_wide(reset_default_limiter):
+    async def main():
+        limiter = trio.CapacityLimiter(1)
+
+        async def configure():
+            set_default_limiter(limiter)
+
+        # Set from another task; a module-level default is still visible here
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(configure)
+
+        first = LimiterProbeRepository(User, probe=limiter)
+        second = LimiterProbeRepository(User, probe=limiter)
+        await first.exists_async("a")
+        await second.exists_async("a")
+
+        assert first.borrowed == [1]
+        assert second.borrowed == [1]
+
+    trio.run(main)
+
+
+def test_max_threads_uses_private_limiter(reset_default_limiter):
+    async def main():
+        shared = trio.CapacityLimiter(1)
+        set_default_limiter(shared)
+
+        repository = LimiterProbeRepository(User, max_threads=2, probe=shared)
+        await repository.exists_async("a")
+
+        assert repository.borrowed == [0]
+
+    trio.run(main)
+
+
+def test_explicit_limiter_is_used():
+    async def main():
+        limiter = trio.CapacityLimiter(3)
+
+        repository = LimiterProbeRepository(User, limiter=limiter, probe=limiter)
+        await repository.exists_async("a")
+
+        assert repository.borrowed == [1]
+
+    trio.run(main)
+
+
+def test_max_threads_and_limiter_are_exclusive():
+    with pytest.raises(ValueError):
+        ThreadedRepository(User, max_threads=2, limiter=trio.CapacityLimiter(2))
+
+
+class CallCountingRepository(ThreadedRepository):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls: list[str] = []
+
+    def save(self, aggregate: User) -> None:
+        self.calls.append("save")
+        super().save(aggregate)
+
+    def save_all(self, aggregates: list[User]) -> None:
+        self.calls.append("save_all")
+        super().save_all(aggregates)
+
+    def find(self, _id: str) -> User | None:
+        self.calls.append("find")
+        return super().find(_id)
+
+    def find_many(self, ids: list[str]) -> list[User | None]:
+        self.calls.append("find_many")
+        return super().find_many(ids)
+
+
+def test_batched_async_calls_offload_once():
+    async def main():
+        repository = CallCountingRepository(User)
+
+        assert await repository.save_all_async([User("a"), User("b")]) is None
+        assert await repository.find_many_async(["b", "missing", "a"]) == [User("b"), None, User("a")]
+        assert repository.calls == ["save_all", "find_many"]
+
+    trio.run(main)
+
+
+def test_in_memory_async_batched_calls():
+    async def main():
+        repository = InMemoryAsyncAggregateRootRepository(User)
+
+        await repository.save_all_async([User("a", "x"), User("b", "y")])
+
+        assert await repository.find_many_async(["a", "c", "b"]) == [User("a", "x"), None, User("b", "y")]
+        assert await repository.find_many_async([]) == []
+
+    trio.run(main)
@@ -0,0 +1,223 @@
+import attrs
+import pytest
+
+from api.domain.aggregate_root import AggregateRoot
+from api.infrastructure.in_memory_aggregate_root_repository import InMemoryAggregateRootRepository
+
+
+@attrs.define
+class User(AggregateRoot):
+    name: str = ""
+    age: int = 0
+
+
+def ids(aggregates) -> list[str]:
+    return sorted(aggregate.id for aggregate in aggregates)
+
+
+def test_unindexed_queries_fall_back_to_scan():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.save_all([User("a", "x", 10), User("b", "y", 20)])
+
+    assert ids(repository.find_by("name", "y")) == ["b"]
+    assert ids(repository.find_in_range("age", 5, 15)) == ["a"]
+    assert ids(repository.find_all_where("age", lambda age: age > 15)) == ["b"]
+
+
+def test_find_all_where_after_compaction():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.register_column("age")
+    repository.save_all([User(str(i), age=i) for i in range(10)])
+
+    # Deleting more than half of the rows triggers compaction
+    for i in range(7):
+        repository.delete(User(str(i)))
+    assert ids(repository.find_all_where("age", lambda age: age >= 0)) == ["7", "8", "9"]
+
+    repository.save(User("8", age=100))
+    repository.save(User("10", age=50))
+    assert ids(repository.find_all_where("age", lambda age: age >= 50)) == ["10", "8"]
+
+    repository.delete(User("7"))
+    repository.delete(User("8"))
+    assert ids(repository.find_all_where("age", lambda age: age >= 0)) == ["10", "9"]
+
+
+def test_register_column_after_delete_all():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.register_column("name")
+    repository.save_all([User("a", "x"), User("b", "y")])
+    repository.delete_all()
+
+    repository.register_column("age")
+    repository.save(User("c", "x", 5))
+
+    assert ids(repository.find_all_where("name", lambda name: name == "x")) == ["c"]
+    assert ids(repository.find_all_where("age", lambda age: age == 5)) == ["c"]
+
+
+def test_register_column_backfills_existing_aggregates():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.save_all([User("a", age=1), User("b", age=2)])
+
+    repository.register_column("age")
+
+    assert ids(repository.find_all_where("age", lambda age: age == 2)) == ["b"]
+
+
+def test_failed_register_column_leaves_repository_usable():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.register_column("age")
+    repository.save(User("a", age=1))
+
+    with pytest.raises(AttributeError):
+        repository.register_column("missing")
+
+    repository.save(User("b", age=2))
+    repository.save_all([User("c", age=3)])
+
+    assert ids(repository.find_all()) == ["a", "b", "c"]
+    assert ids(repository.find_all_where("age", lambda age: age >= 2)) == ["b", "c"]
+
+
+def test_failed_first_register_column_leaves_repository_usable():
+    repository = InMemoryAggregateRootRepository(User)
+    repository.save(User("a", age=1))
+
+    with pytest.raises(AttributeError):
+        repository.register_column("missing")
+
+    repository.save(User("b", age=2))
+    repository.register_column("age")
+
+    assert ids(repository.find_all_where("age", lambda age: age >= 1)) == ["a", "b"]
+
+
+def test_find_by_uses_equality_index():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"])
+    repository.save_all([User("a", "x"), User("b", "x"), User("c", "y")])
+
+    assert ids(repository.find_by("name", "x")) == ["a", "b"]
+    assert repository.find_by("name", "missing") == []
+
+
+def test_resave_moves_aggregate_between_equality_buckets():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"])
+    repository.save_all([User("a", "x"), User("b", "x")])
+
+    user = repository.find("a")
+    user.name = "y"
+    assert ids(repository.find_by("name", "x")) == ["a", "b"]
+
+    repository.save(user)
+    assert ids(repository.find_by("name", "x")) == ["b"]
+    assert ids(repository.find_by("name", "y")) == ["a"]
+
+
+def test_delete_unlinks_equality_index():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"])
+    repository.save_all([User("a", "x"), User("b", "x")])
+
+    repository.delete(User("a"))
+    assert ids(repository.find_by("name", "x")) == ["b"]
+
+    repository.delete(User("b"))
+    assert repository.find_by("name", "x") == []
+
+    repository.save(User("c", "x"))
+    assert ids(repository.find_by("name", "x")) == ["c"]
+
+
+def test_delete_all_clears_equality_index():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"])
+    repository.save_all([User("a", "x"), User("b", "y")])
+
+    repository.delete_all()
+
+    assert repository.find_by("name", "x") == []
+    assert repository.find_by("name", "y") == []
+
+
+def test_failed_save_leaves_repository_unchanged():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name", "age"])
+    repository.register_column("age")
+    repository.save(User("a", "x", 1))
+
+    with pytest.raises(TypeError):
+        repository.save(User("bad", "x", []))
+    with pytest.raises(TypeError):
+        repository.save_all([User("b", "y", 2), User("a", "z", {})])
+
+    assert repository.find("bad") is None
+    assert ids(repository.find_by("name", "x")) == ["a"]
+    assert repository.find_by("name", "z") == []
+    assert ids(repository.find_all_where("age", lambda age: age == 1)) == ["a"]
+
+    repository.delete(repository.find("a"))
+    repository.delete(repository.find("b"))
+    assert list(repository.find_all()) == []
+    assert repository.find_by("name", "x") == []
+    assert repository.find_by("name", "y") == []
+    assert repository.find_by("age", 1) == []
+
+
+def test_find_in_range_orders_by_value():
+    repository = InMemoryAggregateRootRepository(User, range_indexed_fields=["age"])
+    repository.save_all([User("a", age=30), User("b", age=10), User("c", age=20), User("d", age=20)])
+
+    in_range = repository.find_in_range("age", 10, 20)
+    assert in_range[0].id == "b"
+    assert ids(in_range) == ["b", "c", "d"]
+    assert ids(repository.find_in_range("age", 21, 29)) == []
+    assert ids(repository.find_by("age", 30)) == ["a"]
+
+
+def test_resave_moves_aggregate_between_range_buckets():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"], range_indexed_fields=["age"])
+    repository.save_all([User("a", "x", 10), User("b", "x", 20), User("c", "y", 30)])
+
+    user = repository.find("a")
+    user.name = "y"
+    user.age = 40
+    repository.save(user)
+
+    assert ids(repository.find_by("name", "x")) == ["b"]
+    assert ids(repository.find_by("name", "y")) == ["a", "c"]
+    assert repository.find_in_range("age", 0, 15) == []
+    assert [user.id for user in repository.find_in_range("age", 0, 100)] == ["b", "c", "a"]
+
+
+def test_delete_unlinks_range_index():
+    repository = InMemoryAggregateRootRepository(User, range_indexed_fields=["age"])
+    repository.save_all([User("a", age=10), User("b", age=10), User("c", age=20)])
+
+    repository.delete(User("a"))
+    assert ids(repository.find_in_range("age", 10, 10)) == ["b"]
+
+    repository.delete(User("b"))
+    assert repository.find_in_range("age", 0, 15) == []
+    assert ids(repository.find_in_range("age", 0, 100)) == ["c"]
+
+    repository.delete_all()
+    assert repository.find_in_range("age", 0, 100) == []
+
+
+def test_range_index_rejects_none_and_incomparable_values():
+    repository = InMemoryAggregateRootRepository(User, indexed_fields=["name"], range_indexed_fields=["age"])
+    repository.save(User("a", "q", 1))
+
+    with pytest.raises(TypeError):
+        repository.save(User("bad", "q", None))
+    with pytest.raises(TypeError):
+        repository.save(User("bad", "q", "old"))
+
+    assert repository.find("bad") is None
+    assert ids(repository.find_by("name", "q")) == ["a"]
+    assert ids(repository.find_in_range("age", 0, 100)) == ["a"]
+
+    repository.delete(repository.find("a"))
+    assert repository.find_by("name", "q") == []
+    assert repository.find_in_range("age", 0, 100) == []
+
+    repository.save(User("b", "q", 5))
+    assert ids(repository.find_in_range("age", 0, 100)) == ["b"]